@@ -19,8 +19,20 @@ from enum import StrEnum, auto
 
 import numpy as np
 from scipy.spatial.distance import cdist
-from sklearn.cluster import AgglomerativeClustering
-from sklearn.preprocessing import StandardScaler
+from sklearn.cluster import AgglomerativeClustering, MiniBatchKMeans
+
+# Largest dataset size for which the full pairwise distance matrix is
+# precomputed and cached (float32, so ~1.6GB at the limit); beyond this,
+# scoring falls back to computing distances per call
+_DIST_CACHE_MAX_N = 20_000
+# Upper bound on the transient (N, rows, k) distance gather built per
+# chunk in score_batch; the full-batch gather can reach tens of GB at the
+# distance-cache limit, so replicate rows are scored in bounded groups
+_SCORE_BATCH_BYTES = 256 * 1024 * 1024
+# Largest dataset size still clustered with exact agglomerative linkage;
+# above this, the O(N^2) memory / O(N^3) time cost dominates select() and
+# HIERARCHICAL switches to the O(N*k*iter) mini-batch k-means approximation
+_AGGLOMERATIVE_MAX_N = 3_000
 
 
 class SurrogateSelection:
@@ -38,17 +50,38 @@ class SurrogateSelection:
 
     def __init__(self, desc):
         """Constructor for SurrogateSelection calculator class.
-        
+
         Args:
             desc: non-standardized ionization efficiency descriptor matrix
+                as an ndarray or df; the input is never modified, so an
+                array view into an existing df may be passed without a copy
         """
 
-        # Store a mean-variance standardized array of the input descriptors
+        # Store a mean-variance standardized array of the input descriptors;
+        # standardizing directly in float32 halves memory traffic through
+        # the distance computations (the memory-bound hot path) with
+        # negligible accuracy loss, and skips the scaler's float64 fit
+        arr = np.ascontiguousarray(
+            desc.to_numpy() if hasattr(desc, 'to_numpy') else desc,
+            dtype=np.float32
+        )
+        std = arr.std(axis=0)
+        std[std == 0] = 1.0 # Leave constant columns centered, not NaN
+        # pylint: disable-next=C0103 # Silence lowercase variable convention
+        self.X = (arr - arr.mean(axis=0)) / std
+        # Calculate leverages for all data points as the squared row norms
+        # of the reduced QR factor: the numerically stable equivalent of
+        # diag(X (X'X)^-1 X') without materializing the N x N hat matrix
         # pylint: disable-next=C0103 # Silence lowercase variable convention
-        self.X = StandardScaler().fit_transform(desc)
-        # Calculate leverages for all data points
-        self.h = np.diagonal(
-            self.X.dot(np.linalg.inv(self.X.T.dot(self.X)).dot(self.X.T)))
+        Q, _ = np.linalg.qr(self.X, mode='reduced')
+        self.h = np.einsum('ij,ij->i', Q, Q)
+        # Cache pairwise distances once so every score() call becomes an
+        # indexed reduction instead of a fresh N x k distance computation
+        # pylint: disable-next=C0103 # Silence lowercase variable convention
+        self.D = (
+            cdist(self.X, self.X).astype(np.float32)
+            if self.X.shape[0] <= _DIST_CACHE_MAX_N else None
+        )
 
     def _lowest_n_leverage(self, n):
         return np.argpartition(self.h, n, axis=0)[:n:]
@@ -58,7 +91,11 @@ class SurrogateSelection:
 
     @staticmethod
     def _medoid(x):
-        return np.argmin(cdist(x, np.mean(x, axis=0).reshape(1, -1)))
+        # Squared distance to the mean preserves the argmin and fuses into
+        # a subtract + einsum, skipping cdist's per-call dispatch overhead
+        # (this runs once per cluster in the HIERARCHICAL strategy)
+        d = x - x.mean(axis=0)
+        return np.argmin(np.einsum('ij,ij->i', d, d))
 
     def score(self, s):
         """Calculate LARD score for a set of surrogates.
@@ -69,9 +106,41 @@ class SurrogateSelection:
             LARD score for selected surrogates
         """
 
+        if self.D is not None:
+            # Reduce over cached distance columns: no per-pair arithmetic
+            return np.dot(self.h, self.D[:, s].min(axis=1)) / self.X.shape[0]
+
         return np.dot(self.h, np.min(cdist(self.X, self.X[s]), axis=1))\
             / self.X.shape[0]
 
+    def score_batch(self, s_batch):
+        """Calculate LARD scores for a batch of surrogate sets.
+
+        Args:
+            s_batch: 2D array of surrogate index sets, one set per row
+        Returns:
+            array of LARD scores, one per row of s_batch
+        """
+
+        if self.D is not None:
+            # Gather cached distances a bounded group of rows at a time,
+            # reduce over the set dimension, then score each group in one
+            # matvec; chunking caps the transient gather at the configured
+            # byte budget instead of materializing the full batch at once
+            s_batch = np.asarray(s_batch)
+            n_points = self.X.shape[0]
+            rows = max(
+                1, _SCORE_BATCH_BYTES // (4 * n_points * s_batch.shape[1]))
+            scores = np.empty(s_batch.shape[0])
+            for start in range(0, s_batch.shape[0], rows):
+                chunk = s_batch[start:start + rows]
+                mins = self.D[:, chunk].min(axis=2)
+                scores[start:start + rows] = self.h @ mins / n_points
+            return scores
+
+        # Without the distance cache, fall back to per-set scoring
+        return np.array([self.score(s) for s in s_batch])
+
     def select(self, n, strategy):
         """Select surrogates based on specified strategy and number.
         
@@ -96,13 +165,30 @@ class SurrogateSelection:
                 surrogates = self._highest_n_leverage(n_eff)
             case self.Strategy.BALANCED:
                 n_half = int(n_eff / 2)
-                surrogates = np.concatenate([
-                    self._highest_n_leverage(n_half),
-                    self._lowest_n_leverage(n_eff - n_half)
-                ])
+                n_low = n_eff - n_half
+                if n_half:
+                    # One partition with both boundary positions replaces
+                    # separate lowest/highest passes over the leverages
+                    parts = np.argpartition(
+                        self.h, [n_low, X_size - n_half])
+                    surrogates = np.concatenate(
+                        [parts[-n_half:], parts[:n_low]])
+                else:
+                    # n_eff == 1 has no highest half to partition out
+                    surrogates = self._lowest_n_leverage(n_low)
             case self.Strategy.HIERARCHICAL:
-                clusters = AgglomerativeClustering(n_clusters=n_eff)\
-                    .fit_predict(self.X)
+                if X_size > _AGGLOMERATIVE_MAX_N:
+                    # Approximate clustering keeps large datasets sub-second
+                    # at the cost of slightly different cluster boundaries
+                    clusters = MiniBatchKMeans(
+                        n_clusters=n_eff,
+                        batch_size=min(1024, X_size),
+                        n_init=3,
+                        random_state=2025
+                    ).fit_predict(self.X)
+                else:
+                    clusters = AgglomerativeClustering(n_clusters=n_eff)\
+                        .fit_predict(self.X)
                 cl_idx = [np.where(clusters == cl)[0] for cl in range(n_eff)]
                 surrogates = [idx[self._medoid(self.X[idx])] for idx in cl_idx]
             case _:
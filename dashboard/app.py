@@ -1,5 +1,6 @@
 """Parent module for qNTA SurroSel app."""
 
+import numpy as np
 import pandas as pd
 from shiny import App, reactive, render, req, ui
 
@@ -82,16 +83,29 @@ def server(input, output, session):
     def surrogate_labels():
         """Reactively convert surrogate selection data to data point labels."""
 
-        # Initialize an empty list of labels for each point
-        labels = {i: [] for i in range(desc().shape[0])}
-        for strat, (idx, _) in surr().items():
-            # For each in the included surrogate selection strategies...
-            for i in idx:
-                # ...add to the labels of all points selected by that strategy
-                labels[i].append(strat)
-
-        # Join all labels for each point into a single string
-        return ['&'.join(sorted(x)) if x else 'none' for x in labels.values()]
+        # Boolean membership matrix: one row per point, one col per strategy
+        strats = sorted(surr().keys())
+        membership = np.zeros((desc().shape[0], len(strats)), dtype=bool)
+        for col, strat in enumerate(strats):
+            membership[surr()[strat][0], col] = True
+
+        # Pack each row's strategy bits into one uint64 word (strategy count
+        # is far below 64) and deduplicate, so the joined label string is
+        # built only per unique combination and broadcast back by index
+        packed = np.zeros((membership.shape[0], 8), dtype=np.uint8)
+        bits = np.packbits(membership, axis=1, bitorder='little')
+        packed[:, :bits.shape[1]] = bits
+        keys = packed.view(np.uint64).ravel()
+
+        uniq, inv = np.unique(keys, return_inverse=True)
+        unique_labels = np.array([
+            '&'.join(
+                strat for col, strat in enumerate(strats)
+                if int(key) >> col & 1
+            ) or 'none'
+            for key in uniq
+        ])
+        return unique_labels[inv].tolist()
 
     def _set_data(data_, desc_):
         """Callback function to allow child modules to set global data.
@@ -105,7 +119,14 @@ def server(input, output, session):
         sim.set({})
 
         desc.set(desc_)
-        data.set(data_[data_.index.isin(desc_.index)])
+        # desc_ rows are always a subset of data_ (only structurable records
+        # get descriptors), so a reindex is one hash lookup per desc row
+        # rather than an isin mask built over all of data_; reindex raises
+        # on duplicate labels, so duplicate-ID datasets keep the mask path
+        data.set(
+            data_.reindex(desc_.index) if data_.index.is_unique
+            else data_.loc[data_.index.isin(desc_.index)]
+        )
 
     def _set_surr(surr_, sim_):
         """Callback function to allow child modules to set global surrogates.
@@ -128,7 +149,9 @@ def server(input, output, session):
     report_card_server('report', desc, surr)
 
     @reactive.effect
-    @reactive.file_reader(LAST_UPDATED)
+    # The log only changes when a dataset is saved, so a relaxed polling
+    # interval cuts per-session stat traffic with no meaningful lag
+    @reactive.file_reader(LAST_UPDATED, interval_secs=5)
     def update_datasets():
         """Reactively update available datasets on log file change."""
         datasets.set(get_datasets())
@@ -11,9 +11,10 @@ visualizations in other modules.
 
 from webbrowser import open_new_tab
 
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from shiny import module, req
+from shiny import module, reactive, req
 from shinywidgets import output_widget, render_widget
 
 # Universal plotly format parameters
@@ -104,31 +105,105 @@ def colorable_scatterplot_server(
             ids = _get_event_ids(trace, points)
             open_new_tab(SEARCH_URL % BATCH_SEARCH_JOIN_STR.join(ids))
 
-    @render_widget
-    def plot():
-        """Build the main figure widget component for the plot."""
-        req(xcol() and ycol() and not data().empty)
+    def _resolve(col):
+        # Constant column names may be passed as plain strings, bypassing
+        # the reactive graph entirely; callables are reactive reads
+        return col if isinstance(col, str) else col()
+
+    @reactive.calc
+    def _arrays():
+        """Reactively cache contiguous arrays of plottable numeric columns.
+
+        Rebuilt only when the underlying data changes, so re-renders
+        triggered by axis or label changes index a plain dict instead of
+        traversing the frame's BlockManager per column.
+        """
+
+        frame = data()
+        return {
+            col: np.ascontiguousarray(frame[col].to_numpy())
+            for col, dtype in frame.dtypes.items()
+            if isinstance(dtype, np.dtype) and np.issubdtype(dtype, np.number)
+        }
+
+    @reactive.calc
+    def _base_widget():
+        """Reactively cache the figure widget for the current data.
+
+        The widget (and its single trace, event callbacks, and axes) is
+        rebuilt only when the data or plotted columns change; label changes
+        are applied in place by the recolor effect below, so the client
+        never tears down and re-renders the full plot just to repaint
+        marker colors.
+        """
+
+        xval, yval = _resolve(xcol), _resolve(ycol)
+        arrays = _arrays()
+        req(xval in arrays and yval in arrays and not data().empty)
 
         # Show or hide log-scale axis menus
         menus = [_log_menu('x'), _log_menu('y')] if showlog else []
 
-        # Build the base figure
+        # Build the base figure as a single uncolored trace
         fig = px.scatter(
-            data(),
-            x=xcol(),
-            y=ycol(),
-            color=labels(),
+            x=arrays[xval],
+            y=arrays[yval],
             # Required for point indexing
             # Display only, not currently functional
             hover_name=data().index,
-            template=PLOTLY_TEMPLATE,
-            color_discrete_sequence=PLOTLY_COLORS
+            # Restore column names as axis titles for the raw arrays
+            labels={'x': xval, 'y': yval},
+            template=PLOTLY_TEMPLATE
         ).update_layout(updatemenus=menus, **layout_kwargs)
 
         # Set up the figure widget to register click handler
         widg = go.FigureWidget(fig.data, fig.layout)
         for tr in widg.data:
+            # Surface the point's label on hover alongside the legend
+            tr.hovertemplate = tr.hovertemplate.replace(
+                '<extra></extra>', '<br>%{customdata}<extra></extra>')
+            # The data trace stays out of the legend; the recolor effect
+            # maintains one legend-only stub trace per category instead
+            tr.showlegend = False
             tr.on_click(_on_click)
             tr.on_selection(_on_selection)
 
         return widg
+
+    @reactive.effect
+    def _recolor():
+        """Repaint marker colors in place when point labels change."""
+
+        widg = _base_widget()
+        labs = labels()
+        trace = widg.data[0]
+        if not labs or len(labs) != len(trace.x):
+            return # Labels absent or mid-transition; keep current colors
+
+        # Map labels to palette colors through the unique-label inverse
+        # index: one vectorized pass instead of a per-point dict lookup
+        labs_arr = np.asarray(labs)
+        unique, inverse = np.unique(labs_arr, return_inverse=True)
+        palette = np.array([
+            PLOTLY_COLORS[i % len(PLOTLY_COLORS)]
+            for i in range(unique.size)
+        ])
+        # batch_update coalesces the changes into one message to the client
+        with widg.batch_update():
+            trace.marker.color = palette[inverse]
+            trace.customdata = labs_arr
+            # Rebuild the legend-only stub traces for the current
+            # categories, preserving the per-category legend readout; each
+            # stub carries a single null point and never receives events
+            widg.data = widg.data[:1]
+            for lab, color in zip(unique, palette):
+                widg.add_scatter(
+                    x=[None], y=[None], mode='markers',
+                    marker={'color': color}, name=str(lab),
+                    showlegend=True, hoverinfo='skip'
+                )
+
+    @render_widget
+    def plot():
+        """Render the persistent figure widget component for the plot."""
+        return _base_widget()
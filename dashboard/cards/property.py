@@ -28,7 +28,12 @@ def property_card_server(input, output, session, data, labels):
     @reactive.calc
     def num_cols():
         """Reactive calculation of numerical columns in input data."""
-        return data().select_dtypes(include=np.number).columns.tolist()
+        # Scan the dtype array directly; select_dtypes builds a whole
+        # BlockManager projection just to read the column names off it
+        return [
+            col for col, dtype in data().dtypes.items()
+            if isinstance(dtype, np.dtype) and np.issubdtype(dtype, np.number)
+        ]
 
     def _num_cols_select(ax):
         return ui.input_select(
@@ -18,8 +18,12 @@ def report_card_server(input, output, session, desc, surr):
     @render.text
     def report():
         req(surr())
-        return '\n====================\n'.join([
-            f'{strat.upper()}\nLARD: {float(res[1]):.3g}\n'
-            + f'Surrogates Selected:\n{'\n'.join(desc().index[res[0]])}'
+        # Gather the index once as a numpy array; fancy-indexing the pandas
+        # Index inside the loop allocated a fresh Index object per strategy
+        idx = desc().index.to_numpy()
+        parts = [
+            '{}\nLARD: {:.3g}\nSurrogates Selected:\n{}'.format(
+                strat.upper(), float(res[1]), '\n'.join(idx[res[0]]))
             for strat, res in surr().items()
-        ])
+        ]
+        return '\n====================\n'.join(parts)
@@ -1,6 +1,6 @@
 """Card UI element displaying a t-SNE plot of ionization efficiency."""
 
-from shiny import module, reactive, ui
+from shiny import module, ui
 
 from dashboard.cards._shared import (
     colorable_scatterplot, colorable_scatterplot_server)
@@ -18,16 +18,14 @@ def tsne_card(): # pylint: disable=C0116 # Silence docstring error
 # pylint: disable-next=C0116,W0613,W0622 # Silence server syntax errors
 def tsne_card_server(input, output, session, desc, labels):
 
-    def _make_constant_reactive(cnst):
-        return reactive.calc(lambda: cnst)
-
     # pylint: disable-next=E1120 # Silence error from module call
     colorable_scatterplot_server(
         'plot',
         desc,
         labels,
-        _make_constant_reactive('TSNE1'),
-        _make_constant_reactive('TSNE2'),
+        # Constant column names; plain strings skip the reactive graph
+        'TSNE1',
+        'TSNE2',
         showlog=False,
         legend_title='Surrogate Set'
     )
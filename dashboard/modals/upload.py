@@ -5,20 +5,26 @@ data set from a CSV file and store both original data and calculated
 ionization efficiency descriptors as parquet files.
 """
 
-import re
+import asyncio
+import string
 from enum import StrEnum
 from os.path import splitext
 
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv
 from shiny import module, reactive, ui
 
 from calculation.ionization_efficiency import calculate_ionization_efficiency
-from dashboard.utils.files import save_data
+from dashboard.utils.files import save_data, get_datasets_lower_set
 from dashboard.utils.notifications import (
     load_success_notification, error_notification, ValidationErrors)
 
-# Regular expression for dataset name character validation
-NAME_PATTERN = re.compile('[A-Za-z0-9_\\- ]{2,32}')
+# Deletion table stripping every permissible dataset name character; a name
+# passes character validation when translation leaves nothing behind, a
+# C-level byte scan with no regex engine involved
+_INVALID_CHARS = str.maketrans(
+    '', '', string.ascii_letters + string.digits + '_- ')
 
 
 class FileExtensions(StrEnum):
@@ -30,6 +36,94 @@ class FileExtensions(StrEnum):
     TXT = '.txt'
 
 
+def _read_delimited(path, delimiter):
+    """Read a delimited text file via pyarrow's parallel CSV reader.
+
+    Args:
+        path: path of the file to parse
+        delimiter: field delimiter character
+    Returns:
+        df of parsed file data
+    """
+
+    try:
+        # Arrow parses blocks in parallel across threads; the conversion
+        # back to pandas reuses the Arrow buffers instead of copying
+        return pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(use_threads=True,
+                                           block_size=1 << 22),
+            parse_options=pacsv.ParseOptions(delimiter=delimiter)
+        ).to_pandas(split_blocks=True, self_destruct=True)
+    except pa.ArrowInvalid as exc:
+        # Normalize to the pandas error the upload handler already catches
+        raise pd.errors.ParserError(str(exc)) from exc
+
+def _read_excel(path, **kwargs):
+    """Read an Excel workbook, preferring the calamine engine.
+
+    Args:
+        path: path of the workbook to parse
+        **kwargs: additional arguments forwarded to pd.read_excel
+    Returns:
+        df of parsed file data
+    """
+
+    try:
+        # calamine (Rust-based) parses large workbooks roughly an order of
+        # magnitude faster than openpyxl when python-calamine is installed
+        return pd.read_excel(path, engine='calamine', **kwargs)
+    except ImportError:
+        # Fall back to the default engine without the optional dependency
+        return pd.read_excel(path, **kwargs)
+
+def _read_header(path, delimiter):
+    """Read only the column names from a delimited text file.
+
+    Args:
+        path: path of the file to parse
+        delimiter: field delimiter character
+    Returns:
+        list of column names
+    """
+
+    try:
+        # The streaming reader resolves the schema from the first block
+        # without parsing the rest of the file
+        with pacsv.open_csv(
+            path,
+            parse_options=pacsv.ParseOptions(delimiter=delimiter)
+        ) as reader:
+            return list(reader.schema.names)
+    except pa.ArrowInvalid as exc:
+        raise pd.errors.ParserError(str(exc)) from exc
+
+
+# Extension-dispatch tables for full parses and header-only reads; a dict
+# lookup replaces the per-call match machinery and keeps one obvious place
+# to swap in alternative readers per format
+_READERS = {
+    FileExtensions.CSV: lambda path: _read_delimited(path, ','),
+    FileExtensions.XLS: _read_excel,
+    FileExtensions.XLSX: _read_excel,
+    FileExtensions.TSV: lambda path: _read_delimited(path, '\t'),
+    # Infer delimiter from unspecified tabular text file
+    FileExtensions.TXT: lambda path: pd.read_table(
+        path, sep=None, engine='python'),
+}
+
+_HEADER_READERS = {
+    FileExtensions.CSV: lambda path: _read_header(path, ','),
+    FileExtensions.XLS: lambda path: _read_excel(
+        path, nrows=0).columns.tolist(),
+    FileExtensions.XLSX: lambda path: _read_excel(
+        path, nrows=0).columns.tolist(),
+    FileExtensions.TSV: lambda path: _read_header(path, '\t'),
+    FileExtensions.TXT: lambda path: pd.read_table(
+        path, sep=None, engine='python', nrows=0).columns.tolist(),
+}
+
+
 @module.ui
 def upload_modal(): # pylint: disable=C0116 # Silence missing docstring error
     return ui.modal(
@@ -62,13 +156,13 @@ def upload_modal(): # pylint: disable=C0116 # Silence missing docstring error
 # pylint: disable-next=C0116,W0622,W0613,R0915 # Silence server syntax errors
 def upload_modal_server(input, output, session, datasets, _set_data):
 
-    # Reactive value to hold temporary data loaded from the file input,
-    # used to populate selectors before processing & persisting the data
-    temp = reactive.value(pd.DataFrame())
+    # Reactive value to hold column names from the file input, used to
+    # populate selectors before the file is fully parsed on upload
+    temp_cols = reactive.value([])
 
     def _clear_temp():
-        """Reset temp reactive to an empty data frame."""
-        temp.set(pd.DataFrame())
+        """Reset temp column reactive to an empty list."""
+        temp_cols.set([])
 
     def _read_file(file):
         """Read a pandas df from a variety of tabular data formats.
@@ -80,21 +174,25 @@ def upload_modal_server(input, output, session, datasets, _set_data):
         """
 
         _, ext = splitext(file['name'])
-        content = file['datapath']
-
-        df = pd.DataFrame()
-        match ext:
-            case FileExtensions.CSV:
-                df = pd.read_csv(content)
-            case FileExtensions.XLS | FileExtensions.XLSX:
-                df = pd.read_excel(content)
-            case FileExtensions.TSV:
-                df = pd.read_table(content, sep='\t')
-            case FileExtensions.TXT:
-                # Infer delimiter from unspecified tabular text file
-                df = pd.read_table(content, sep=None, engine='python')
-
-        return df
+        reader = _READERS.get(ext)
+        return reader(file['datapath']) if reader else pd.DataFrame()
+
+    def _read_columns(file):
+        """Read only the column names from an uploaded tabular file.
+
+        This is the cheap first stage of the upload: the dropdowns only
+        need the header, so the full parse is deferred until the user
+        actually submits the upload.
+
+        Args:
+            file: shiny ui.input_file upload content
+        Returns:
+            list of column names from the parsed file header
+        """
+
+        _, ext = splitext(file['name'])
+        reader = _HEADER_READERS.get(ext)
+        return reader(file['datapath']) if reader else []
     
     def _validate_name(name):
         """Validate user input dataset name.
@@ -113,11 +211,13 @@ def upload_modal_server(input, output, session, datasets, _set_data):
         if not name:
             # Validate name was provided
             errors.append(ValidationErrors.NO_NAME)
-        elif name.lower() in [x.lower() for x in datasets()]:
-            # Validate name not duplicate of existing (case insensitive)
+        elif name.lower() in get_datasets_lower_set():
+            # Validate name not duplicate of existing (case insensitive);
+            # the precomputed set makes this an O(1) lookup per check
             errors.append(ValidationErrors.NAME_DUP)
-        elif not re.fullmatch(NAME_PATTERN, name):
-            # Validate name permissible
+        elif not 2 <= len(name) <= 32 or name.translate(_INVALID_CHARS):
+            # Validate name permissible: length bounds plus the translate
+            # charset scan reproduce the old [A-Za-z0-9_\- ]{2,32} regex
             errors.append(ValidationErrors.NAME_INVALID)
 
         return errors
@@ -159,9 +259,14 @@ def upload_modal_server(input, output, session, datasets, _set_data):
             processed data df
         """
 
-        # Set index, drop user ignored columns, and return a deep copy of data
-        return data.copy(deep=True).set_index(id_col)\
-            .drop(columns=[col for col in ignore_cols if not col == qrs_col])
+        # Select only the kept columns, then set the index on the reduced
+        # frame; this allocates just the surviving columns instead of deep
+        # copying the entire upload before dropping
+        keep = [
+            col for col in data.columns
+            if col in (id_col, qrs_col) or col not in ignore_cols
+        ]
+        return data.loc[:, keep].set_index(id_col)
 
     def _clear_and_close():
         """Clear entered data and close the modal."""
@@ -171,50 +276,60 @@ def upload_modal_server(input, output, session, datasets, _set_data):
     @reactive.effect
     @reactive.event(input.file)
     def upload_temp():
-        """Read the uploaded file into the temp reactive when input changes."""
+        """Read uploaded column names into the reactive when input changes."""
 
         # Check if user has provided a file
         file = input.file()
         if not file:
-            # Reset temp data and stop processing if no file contents
+            # Reset temp columns and stop processing if no file contents
             _clear_temp()
             return
 
         try:
-            # Attempt parsing file contents
-            temp.set(_read_file(file[0]))
+            # Attempt parsing file header only
+            temp_cols.set(_read_columns(file[0]))
         except (pd.errors.EmptyDataError, pd.errors.ParserError):
-            # Reset temp data if parser errored out
+            # Reset temp columns if parser errored out
             _clear_temp()
         finally:
-            # If final data is empty for any reason, notify user
-            if temp().empty:
+            # If final column list is empty for any reason, notify user
+            if not temp_cols():
                 error_notification(ValidationErrors.FILE_INVALID)
 
     @reactive.effect()
-    @reactive.event(temp)
+    @reactive.event(temp_cols)
     def update_select():
-        """Update select inputs with columns from temp when it changes."""
+        """Update select inputs with columns when they change."""
 
-        # Get available columns from temp data (or empty list if temp is empty)
-        choices = [] if temp().empty else list(temp().columns)
-
-        # Update select inputs with available columns
+        # Update select inputs with available columns; the multi-select
+        # serves its choices from the server on demand rather than pushing
+        # the full column list to the client in the update message
+        choices = temp_cols()
         ui.update_select('id_col', choices=choices)
         ui.update_select('qrs_col', choices=choices)
-        ui.update_selectize('ignore_cols', choices=choices)
+        ui.update_selectize('ignore_cols', choices=choices, server=True)
 
     @reactive.effect
     @reactive.event(input.upload)
-    def upload():
+    async def upload():
         """Perform data validation and final upload on upload button click."""
 
         # Check for dataset name validation errors
         errors = _validate_name(name := input.name())
+
+        # Perform the deferred full parse of the uploaded file; the
+        # file-select handler only read the header for the dropdowns
+        full_data = pd.DataFrame()
+        if file := input.file():
+            try:
+                full_data = _read_file(file[0])
+            except (pd.errors.EmptyDataError, pd.errors.ParserError):
+                pass # Leave data empty; validation reports it below
+
         # Check for data and column selection validation errors
         errors.extend(
             _validate_data(
-                temp(),
+                full_data,
                 id_col := input.id_col(),
                 qrs_col := input.qrs_col()
             )
@@ -228,8 +343,12 @@ def upload_modal_server(input, output, session, datasets, _set_data):
             return # Stop processing, but do not close the modal
 
         # Process data and calculate descriptors
-        data = _process_data(temp(), id_col, qrs_col, input.ignore_cols())
-        desc = calculate_ionization_efficiency(data[qrs_col], data.index)
+        data = _process_data(full_data, id_col, qrs_col, input.ignore_cols())
+        # Run the descriptor + TSNE computation in a worker thread so the
+        # Shiny event loop (and the rest of the UI) stays responsive for
+        # the duration of a potentially multi-second calculation
+        desc = await asyncio.to_thread(
+            calculate_ionization_efficiency, data[qrs_col], data.index)
 
         # Save data frames as parquet files
         save_data(name, data, desc)
@@ -5,6 +5,8 @@ automated surrogate selection or to manually select surrogates for
 comparison.
 """
 
+import asyncio
+
 import numpy as np
 from faicons import icon_svg
 from shiny import module, reactive, ui
@@ -70,11 +72,35 @@ def dashboard_sidebar():
 # pylint: disable-next=C0116,W0613,W0622 # Silence server syntax errors
 def dashboard_sidebar_server(input, output, session, desc, _set_surr):
 
+    @reactive.calc
+    def selector():
+        """Reactively cache the selector instance for the current dataset.
+
+        Construction runs the standardization, leverage, and distance-cache
+        work, so rebuilding it only when desc() changes saves that cost on
+        every Select click after the first.
+        """
+        # Hand over the raw array view; the selector standardizes into its
+        # own buffer, so no defensive DataFrame copy is needed
+        return SurrogateSelection(
+            desc()[IONIZATION_EFFICIENCY_EMBEDDING].to_numpy(copy=False))
+
     @reactive.calc
     def user_idx():
         """Reactively process user entered surrogate IDs to list of indices."""
-        return np.where(
-            np.isin(desc().index, input.user_ids().splitlines()))[0]
+        index = desc().index
+        ids = input.user_ids().splitlines()
+        # get_indexer raises on non-unique indexes, so duplicate-ID
+        # datasets fall back to the np.isin scan
+        if not index.is_unique:
+            return np.where(np.isin(index, ids))[0]
+
+        # get_indexer resolves IDs through the index's hash table in
+        # O(N+M), where np.isin on string arrays scans O(N*M); unmatched
+        # IDs come back as -1 and are dropped, and np.unique restores the
+        # sorted de-duplicated output the old np.where form produced
+        idx = index.get_indexer(ids)
+        return np.unique(idx[idx >= 0])
 
     def _validate_auto(n, strats):
         """Validate inputs to automated surrogate selection.
@@ -137,89 +163,152 @@ def dashboard_sidebar_server(input, output, session, desc, _set_surr):
 
         return {'user': (user_idx, selector.score(user_idx))}
 
-    def _process_conditional(switch, selector, _validate_fn, _process_fn, *args):
-        """Chain validation, error display, and processing of selection.
-        
+    def _validate_conditional(switch, _validate_fn, *args):
+        """Validate one selection mode and display any errors.
+
         Args:
-            switch: condition to check whether selection should be processed
-            selector: SurrogateSelection instance
+            switch: condition to check whether selection mode is enabled
             _validate_fn: input validation function
-            _process_fn: input processing function
-            *args: arguments to validation and processing functions
+            *args: arguments to the validation function
         Returns:
-            dict of surrogate selections and score for each strategy
+            True if the mode is enabled and its inputs validated
         """
 
-        surr = {}
-        if switch:
-            errors = _validate_fn(*args)
-            if errors:
-                for err in errors:
-                    error_notification(err)
-            else:
-                surr = _process_fn(selector, *args)
+        if not switch:
+            return False
 
-        return surr
+        errors = _validate_fn(*args)
+        for err in errors:
+            error_notification(err)
+
+        return not errors
 
     def _simulate_random(selector, ns):
+        # Draw all replicate index sets per n in one batch and score them
+        # in a single vectorized pass, rather than RANDOM_REPS separate
+        # select() calls per n; argpartition of uniform noise yields
+        # uniform without-replacement samples row by row
+        rng = np.random.default_rng()
+        n_points = selector.X.shape[0]
         scores = []
         for n in ns:
-            scores.extend([
-                selector.select(n, SurrogateSelection.Strategy.RANDOM)[1]
-                for _ in range(RANDOM_REPS)
-            ])
+            draws = rng.random(
+                (RANDOM_REPS, n_points)).argpartition(n - 1, axis=1)[:, :n]
+            scores.extend(selector.score_batch(draws))
         return {
             'scores': scores,
             'ns': np.repeat(ns, RANDOM_REPS)
         }
 
+    def _run_selection(sel, auto_args, user_arg, ns):
+        """Compute surrogate selections and the random comparison.
+
+        This runs on a worker thread via the extended task below, so it
+        must not touch reactive state.
+
+        Args:
+            sel: SurrogateSelection instance with relevant data
+            auto_args: (n, strats) tuple for automated selection, or None
+            user_arg: user selected surrogate indices, or None
+            ns: sorted unique effective sizes for the random simulation
+        Returns:
+            tuple of surrogate selection dict and random simulation dict
+        """
+
+        surr = {}
+        if auto_args is not None:
+            surr |= _process_auto(sel, *auto_args)
+        if user_arg is not None:
+            surr |= _process_user(sel, user_arg)
+
+        return surr, _simulate_random(sel, ns)
+
+    @ui.bind_task_button(button_id='select')
+    @reactive.extended_task
+    async def run_selection(sel, auto_args, user_arg, ns, source_index):
+        """Run the heavy selection work off the Shiny event loop.
+
+        The task button stays in its busy state until the task finishes,
+        while the UI remains responsive for the duration. The source
+        dataset index is carried through so stale results can be dropped
+        if the dataset changes mid-run.
+        """
+        surr, sim = await asyncio.to_thread(
+            _run_selection, sel, auto_args, user_arg, ns)
+        return surr, sim, source_index
+
     @reactive.effect
     @reactive.event(input.select)
     def select():
-        """Perform surrogate selection on click."""
+        """Validate inputs and launch surrogate selection on click."""
+
+        # Bind reactive reads once; repeat calls walk the reactive graph
+        d = desc()
+        uidx = user_idx()
 
         # Check data is loaded
-        if desc().empty:
+        if d.empty:
             error_notification(ValidationErrors.NO_DATA)
+            # Reset the bound task button since no task will be launched
+            ui.update_task_button('select', state='ready')
             return # Short-circuit with error notification if not
 
-        # Initialize selector instance
-        selector = SurrogateSelection(desc()[IONIZATION_EFFICIENCY_EMBEDDING])
-        # Process automated and/or user surrogate selection
-        surr = _process_conditional(
-            include_auto := input.include_auto(),
-            selector,
+        # Validate each enabled selection mode, surfacing any input errors
+        auto_ok = _validate_conditional(
+            input.include_auto(),
             _validate_auto,
-            _process_auto,
             n_auto := input.n(),
-            input.strats()
-        ) | _process_conditional(
-            include_user := input.include_user(),
-            selector,
-            _validate_user,
-            _process_user,
-            user_idx()
+            strats := input.strats()
         )
+        user_ok = _validate_conditional(
+            input.include_user(), _validate_user, uidx)
+
+        # Proceed only if at least one enabled mode validated
+        if not (auto_ok or user_ok):
+            ui.update_task_button('select', state='ready')
+            return
+
+        # Collect sizes to compare against random simulation
+        ns = list(RANDOM_NS)
+        if user_ok and (n_user := len(uidx)) > 0:
+            ns.append(n_user)
+        if auto_ok:
+            ns.append(n_auto)
+
+        # Map fractional n values to effective counts and sort/deduplicate
+        # in one C-level pass, deduplicating after conversion so a raw
+        # count and an equivalent fraction collapse to one simulation;
+        # rounding and clamping to the dataset size mirror select()'s
+        # n_eff handling, since oversized or sub-1 counts would crash the
+        # batched draw in _simulate_random
+        ns_arr = np.asarray(ns, dtype=np.float64)
+        unique_int_ns = np.unique(np.clip(
+            np.round(np.where(ns_arr < 1, d.shape[0] * ns_arr, ns_arr)),
+            1, d.shape[0]
+        ).astype(np.int64))
+
+        # Hand the heavy computation off to the background task
+        run_selection(
+            selector(),
+            (n_auto, strats) if auto_ok else None,
+            uidx if user_ok else None,
+            unique_int_ns,
+            d.index
+        )
+
+    @reactive.effect
+    def apply_selection():
+        """Publish completed selection results to global app state."""
+
+        surr, sim, source_index = run_selection.result()
+        # Drop results whose source dataset has been replaced mid-run:
+        # the selected indices are only meaningful against the desc they
+        # were computed from (isolate avoids re-publishing on desc change)
+        with reactive.isolate():
+            if source_index is not desc().index:
+                return
 
-        # Proceed if selection succeeded
-        if surr:
-            ns = RANDOM_NS
-            if include_user and (n_user := len(user_idx())) > 0:
-                ns.append(n_user)
-            if include_auto:
-                ns.append(n_auto)
-
-            # Get effective size of fractional n values and ensure uniqueness
-            unique_int_ns = [
-                n if n >= 1 else round(desc().shape[0] * n)
-                for n in list(set(ns))
-            ]
-
-            # Execute random simulation
-            sim = _simulate_random(selector, sorted(unique_int_ns))
-
-            # Update global surrogate selection data using callback
-            _set_surr(surr, sim)
+        _set_surr(surr, sim)
 
     @reactive.effect
     @reactive.event(desc)
@@ -1,5 +1,6 @@
 """Define content and config for reusable pop-up notifications to the user."""
 
+import functools
 from enum import auto, StrEnum
 
 from shiny.ui import notification_show
@@ -47,6 +48,15 @@ def _notification(message, type=DEFAULT_TYPE):
     # Generic notification function with a specified type and default duration
     notification_show(message, type=type, duration=DEFAULT_DURATION)
 
+# Zero-argument error notification callables prebound at import time, so
+# firing an error inside a reactive flush is a dict lookup plus call with
+# no per-call keyword dispatch
+_ERROR_FIRERS = {
+    key: functools.partial(
+        notification_show, message, type='error', duration=DEFAULT_DURATION)
+    for key, message in ERROR_MESSAGES.items()
+}
+
 def load_success_notification(n_records, n_structs):
     """Display a notification for successful data load.
     
@@ -64,7 +74,7 @@ def error_notification(key):
         key: dictionary key (from ValidationErrors enum) for error type
     """
 
-    if key in ERROR_MESSAGES:
-        _notification(ERROR_MESSAGES[key], type='error')
-    else:
+    fire = _ERROR_FIRERS.get(key)
+    if fire is None:
         raise ValueError(f'Error key {key} not found.')
+    fire()